@@ -3,22 +3,30 @@
 
 This module provides the following classes:
 
+- RateLimiter
 - Session
 """
 
 from __future__ import annotations
 
 import platform
-from collections import OrderedDict
-from typing import Any
-from urllib.parse import urlencode
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from math import ceil
+from typing import Any, TypeVar
+from urllib.parse import parse_qs, urlencode, urlsplit
 
 import requests
-from pydantic import TypeAdapter, ValidationError
-from ratelimit import limits, sleep_and_retry
+from pydantic import BaseModel, TypeAdapter, ValidationError
 from requests.adapters import HTTPAdapter
 from urllib3 import Retry
 
+try:
+    from orjson import loads as json_loads
+except ImportError:  # pragma: no cover
+    from json import loads as json_loads
+
 # Alias these modules to prevent namespace collision with methods.
 from mokkari import __version__, exceptions, sqlite_cache
 from mokkari.schemas.arc import Arc
@@ -34,6 +42,70 @@ from mokkari.schemas.team import Team
 from mokkari.schemas.universe import Universe
 
 ONE_MINUTE = 60
+# The maximum number of result pages requested at the same time.
+MAX_PAGE_WORKERS = 8
+# The API's reply to a request for a page past the last one.
+INVALID_PAGE = "Invalid page."
+
+# Building a TypeAdapter compiles a validator, so create them once and share them.
+_BASE_RESOURCE_LIST = TypeAdapter(list[BaseResource])
+_BASE_ISSUE_LIST = TypeAdapter(list[BaseIssue])
+_BASE_SERIES_LIST = TypeAdapter(list[BaseSeries])
+_GENERIC_ITEM_LIST = TypeAdapter(list[GenericItem])
+
+_ModelT = TypeVar("_ModelT", bound=BaseModel)
+_ItemT = TypeVar("_ItemT")
+
+
+def _page_url(url: str, page: int) -> str:
+    """Return a copy of a paginated URL pointing at another page.
+
+    The query is encoded the same way the API encodes its 'next' links, so the
+    URL matches the key the page is cached under.
+    """
+    parts = urlsplit(url)
+    query = parse_qs(parts.query, keep_blank_values=True)
+    query["page"] = [str(page)]
+    return parts._replace(query=urlencode(sorted(query.items()), doseq=True)).geturl()
+
+
+class RateLimiter:
+    """A thread-safe token bucket limiting how often requests are sent.
+
+    The bucket starts full, so up to ``calls`` requests can be made at once, and
+    then refills at a steady ``calls / period`` tokens per second.
+
+    Args:
+        calls: The maximum number of requests allowed in a burst.
+        period: The number of seconds it takes for an empty bucket to refill.
+    """
+
+    def __init__(self: RateLimiter, calls: int, period: float) -> None:
+        """Initialize a RateLimiter with a full bucket."""
+        self.calls = calls
+        self.rate = calls / period
+        self._tokens = float(calls)
+        self._last_refill = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self: RateLimiter) -> None:
+        """Take a token from the bucket, sleeping only as long as it takes to refill one."""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(
+                self.calls, self._tokens + (now - self._last_refill) * self.rate
+            )
+            self._last_refill = now
+            # Reserve the token before sleeping so concurrent callers queue up
+            # behind this one instead of waking at the same time.
+            self._tokens -= 1
+            deficit = -self._tokens
+        if deficit > 0:
+            time.sleep(deficit / self.rate)
+
+
+# Shared by every Session so the limit applies to the whole process.
+_RATE_LIMITER = RateLimiter(calls=25, period=ONE_MINUTE)
 
 
 class Session:
@@ -42,7 +114,10 @@ class Session:
     Args:
         username: A string representing the username for authentication.
         passwd: A string representing the password for authentication.
-        cache: An optional SqliteCache object for caching data.
+        cache: An optional SqliteCache object for caching data. Pages of a list
+            are retrieved from several threads at once, so any other cache object
+            must be safe to use from more than one thread. Data read from the
+            cache is never modified, so it may hand out the objects it stores.
         user_agent: An optional string representing the user agent for the session.
     """
 
@@ -60,9 +135,44 @@ class Session:
             "User-Agent": f"{f'{user_agent} ' if user_agent is not None else ''}"
             f"Mokkari/{__version__} ({platform.system()}; {platform.release()})"
         }
+        # A str.format template, filled in with the endpoint path.
         self.api_url = "https://metron.cloud/api/{}/"
         self.cache = cache
 
+        # Reuse a single HTTP session so connections are kept alive between requests.
+        self._session = requests.Session()
+        self._session.auth = (self.username, self.passwd)
+        self._session.headers.update(self.header)
+        # One pooled connection per page worker, so concurrent page fetches
+        # don't open and discard extra connections.
+        retry = Retry(connect=3, backoff_factor=0.5)
+        adapter = HTTPAdapter(
+            pool_connections=1, pool_maxsize=MAX_PAGE_WORKERS, max_retries=retry
+        )
+        self._session.mount("https://", adapter)
+
+    def __enter__(self: Session) -> Session:  # noqa: PYI034
+        """Return the Session object when used as a context manager."""
+        return self
+
+    def __exit__(self: Session, *args: object) -> None:
+        """Close the Session object when leaving the context manager."""
+        self.close()
+
+    def close(self: Session) -> None:
+        """Close the underlying HTTP session and release its pooled connections.
+
+        Any data still being written to the cache is flushed first.
+
+        Raises:
+            CacheError: If the cache failed to write any data.
+        """
+        try:
+            if flush := getattr(self.cache, "flush", None):
+                flush()
+        finally:
+            self._session.close()
+
     def _call(
         self: Session,
         endpoint: list[str | int],
@@ -83,26 +193,17 @@ class Session:
         if params is None:
             params = {}
 
-        cache_params = ""
-        if params:
-            ordered_params = OrderedDict(sorted(params.items(), key=lambda t: t[0]))
-            cache_params = f"?{urlencode(ordered_params)}"
-
-        url = self.api_url.format("/".join(str(e) for e in endpoint))
-        cache_key = f"{url}{cache_params}"
+        url = self.api_url.format("/".join(map(str, endpoint)))
+        # The cache key is only needed when there's a cache to look in.
+        cache_key = url
+        if self.cache and params:
+            cache_key = f"{url}?{urlencode(sorted(params.items()))}"
 
         cached_response = self._get_results_from_cache(cache_key)
         if cached_response is not None:
             return cached_response
 
-        data = self._request_data(url, params)
-
-        if "detail" in data:
-            raise exceptions.ApiError(data["detail"])
-
-        self._save_results_to_cache(cache_key, data)
-
-        return data
+        return self._fetch(url, cache_key, params)
 
     def creator(self: Session, _id: int) -> Creator:
         """Retrieve information about a creator with the specified ID.
@@ -114,15 +215,9 @@ class Session:
             A Creator object containing information about the specified creator.
 
         Raises:
-            ValidationError: If there is an error validating the response data.
+            ApiError: If there is an error in the API response data validation.
         """
-        resp = self._call(["creator", _id])
-        adaptor = TypeAdapter(Creator)
-        try:
-            result = adaptor.validate_python(resp)
-        except ValidationError as error:
-            raise exceptions.ApiError(error) from error
-        return result
+        return self._get_item(Creator, ["creator", _id])
 
     def creators_list(
         self: Session, params: dict[str, str | int] | None = None
@@ -139,13 +234,7 @@ class Session:
             ApiError: If there is an error in the API response data validation.
 
         """
-        resp = self._get_results(["creator"], params)
-        adaptor = TypeAdapter(list[BaseResource])
-        try:
-            result = adaptor.validate_python(resp["results"])
-        except ValidationError as error:
-            raise exceptions.ApiError(error) from error
-        return result
+        return self._get_list(_BASE_RESOURCE_LIST, ["creator"], params)
 
     def character(self: Session, _id: int) -> Character:
         """Retrieve information about a character with the specified ID.
@@ -160,13 +249,7 @@ class Session:
             ApiError: If there is an error in the API response data validation.
 
         """
-        resp = self._call(["character", _id])
-        adaptor = TypeAdapter(Character)
-        try:
-            result = adaptor.validate_python(resp)
-        except ValidationError as error:
-            raise exceptions.ApiError(error) from error
-        return result
+        return self._get_item(Character, ["character", _id])
 
     def characters_list(
         self: Session, params: dict[str, str | int] | None = None
@@ -183,13 +266,7 @@ class Session:
             ApiError: If there is an error in the API response data validation.
 
         """
-        resp = self._get_results(["character"], params)
-        adaptor = TypeAdapter(list[BaseResource])
-        try:
-            result = adaptor.validate_python(resp["results"])
-        except ValidationError as error:
-            raise exceptions.ApiError(error) from error
-        return result
+        return self._get_list(_BASE_RESOURCE_LIST, ["character"], params)
 
     def character_issues_list(self: Session, _id: int) -> list[BaseIssue]:
         """Retrieve a list of issues related to a character with the specified ID.
@@ -204,13 +281,7 @@ class Session:
             ApiError: If there is an error in the API response data validation.
 
         """
-        resp = self._get_results(["character", _id, "issue_list"])
-        adaptor = TypeAdapter(list[BaseIssue])
-        try:
-            result = adaptor.validate_python(resp["results"])
-        except ValidationError as err:
-            raise exceptions.ApiError(err) from err
-        return result
+        return self._get_list(_BASE_ISSUE_LIST, ["character", _id, "issue_list"])
 
     def publisher(self: Session, _id: int) -> Publisher:
         """Retrieve information about a publisher with the specified ID.
@@ -222,13 +293,7 @@ class Session:
             A Publisher object containing information about the specified publisher.
 
         """
-        resp = self._call(["publisher", _id])
-        adaptor = TypeAdapter(Publisher)
-        try:
-            result = adaptor.validate_python(resp)
-        except ValidationError as err:
-            raise exceptions.ApiError(err) from err
-        return result
+        return self._get_item(Publisher, ["publisher", _id])
 
     def publishers_list(
         self: Session, params: dict[str, str | int] | None = None
@@ -245,13 +310,7 @@ class Session:
             ApiError: If there is an error in the API response data validation.
 
         """
-        resp = self._get_results(["publisher"], params)
-        adapter = TypeAdapter(list[BaseResource])
-        try:
-            result = adapter.validate_python(resp["results"])
-        except ValidationError as err:
-            raise exceptions.ApiError(err) from err
-        return result
+        return self._get_list(_BASE_RESOURCE_LIST, ["publisher"], params)
 
     def team(self: Session, _id: int) -> Team:
         """Retrieve information about a team with the specified ID.
@@ -265,13 +324,7 @@ class Session:
         Raises:
             ApiError: If there is an error in the API response data validation.
         """
-        resp = self._call(["team", _id])
-        adaptor = TypeAdapter(Team)
-        try:
-            result = adaptor.validate_python(resp)
-        except ValidationError as error:
-            raise exceptions.ApiError(error) from error
-        return result
+        return self._get_item(Team, ["team", _id])
 
     def teams_list(
         self: Session, params: dict[str, str | int] | None = None
@@ -288,13 +341,7 @@ class Session:
             ApiError: If there is an error in the API response data validation.
 
         """
-        resp = self._get_results(["team"], params)
-        adapter = TypeAdapter(list[BaseResource])
-        try:
-            result = adapter.validate_python(resp["results"])
-        except ValidationError as err:
-            raise exceptions.ApiError(err) from err
-        return result
+        return self._get_list(_BASE_RESOURCE_LIST, ["team"], params)
 
     def team_issues_list(self: Session, _id: int) -> list[BaseIssue]:
         """Retrieve a list of issues related to a team with the specified ID.
@@ -308,13 +355,7 @@ class Session:
         Raises:
             ApiError: If there is an error in the API response data validation.
         """
-        resp = self._get_results(["team", _id, "issue_list"])
-        adapter = TypeAdapter(list[BaseIssue])
-        try:
-            result = adapter.validate_python(resp["results"])
-        except ValidationError as err:
-            raise exceptions.ApiError(err) from err
-        return result
+        return self._get_list(_BASE_ISSUE_LIST, ["team", _id, "issue_list"])
 
     def arc(self: Session, _id: int) -> Arc:
         """Retrieve information about an arc with the specified ID.
@@ -328,13 +369,7 @@ class Session:
         Raises:
             ApiError: If there is an error in the API response data validation.
         """
-        resp = self._call(["arc", _id])
-        adaptor = TypeAdapter(Arc)
-        try:
-            result = adaptor.validate_python(resp)
-        except ValidationError as err:
-            raise exceptions.ApiError(err) from err
-        return result
+        return self._get_item(Arc, ["arc", _id])
 
     def arcs_list(
         self: Session, params: dict[str, str | int] | None = None
@@ -350,13 +385,7 @@ class Session:
         Raises:
             ApiError: If there is an error in the API response data validation.
         """
-        resp = self._get_results(["arc"], params)
-        adapter = TypeAdapter(list[BaseResource])
-        try:
-            result = adapter.validate_python(resp["results"])
-        except ValidationError as err:
-            raise exceptions.ApiError(err) from err
-        return result
+        return self._get_list(_BASE_RESOURCE_LIST, ["arc"], params)
 
     def arc_issues_list(self: Session, _id: int) -> list[BaseIssue]:
         """Retrieve a list of issues related to an arc with the specified ID.
@@ -370,13 +399,7 @@ class Session:
         Raises:
             ApiError: If there is an error in the API response data validation.
         """
-        resp = self._get_results(["arc", _id, "issue_list"])
-        adaptor = TypeAdapter(list[BaseIssue])
-        try:
-            result = adaptor.validate_python(resp["results"])
-        except ValidationError as err:
-            raise exceptions.ApiError(err) from err
-        return result
+        return self._get_list(_BASE_ISSUE_LIST, ["arc", _id, "issue_list"])
 
     def series(self: Session, _id: int) -> Series:
         """Retrieve information about a series with the specified ID.
@@ -390,13 +413,7 @@ class Session:
         Raises:
             ApiError: If there is an error in the API response data validation.
         """
-        resp = self._call(["series", _id])
-        adaptor = TypeAdapter(Series)
-        try:
-            result = adaptor.validate_python(resp)
-        except ValidationError as err:
-            raise exceptions.ApiError(err) from err
-        return result
+        return self._get_item(Series, ["series", _id])
 
     def series_list(
         self: Session, params: dict[str, str | int] | None = None
@@ -412,13 +429,7 @@ class Session:
         Raises:
             ApiError: If there is an error in the API response data validation.
         """
-        resp = self._get_results(["series"], params)
-        adaptor = TypeAdapter(list[BaseSeries])
-        try:
-            result = adaptor.validate_python(resp["results"])
-        except ValidationError as err:
-            raise exceptions.ApiError(err) from err
-        return result
+        return self._get_list(_BASE_SERIES_LIST, ["series"], params)
 
     def series_type_list(
         self: Session, params: dict[str, str | int] | None = None
@@ -434,13 +445,7 @@ class Session:
         Raises:
             ApiError: If there is an error in the API response data validation.
         """
-        resp = self._get_results(["series_type"], params)
-        adaptor = TypeAdapter(list[GenericItem])
-        try:
-            result = adaptor.validate_python(resp["results"])
-        except ValidationError as err:
-            raise exceptions.ApiError(err) from err
-        return result
+        return self._get_list(_GENERIC_ITEM_LIST, ["series_type"], params)
 
     def issue(self: Session, _id: int) -> Issue:
         """Retrieve information about an issue with the specified ID.
@@ -454,13 +459,7 @@ class Session:
         Raises:
             ApiError: If there is an error in the API response data validation.
         """
-        resp = self._call(["issue", _id])
-        adaptor = TypeAdapter(Issue)
-        try:
-            result = adaptor.validate_python(resp)
-        except ValidationError as error:
-            raise exceptions.ApiError(error) from error
-        return result
+        return self._get_item(Issue, ["issue", _id])
 
     def issues_list(
         self: Session, params: dict[str, str | int] | None = None
@@ -476,13 +475,7 @@ class Session:
         Raises:
             ApiError: If there is an error in the API response data validation.
         """
-        resp = self._get_results(["issue"], params)
-        adaptor = TypeAdapter(list[BaseIssue])
-        try:
-            result = adaptor.validate_python(resp["results"])
-        except ValidationError as err:
-            raise exceptions.ApiError(err) from err
-        return result
+        return self._get_list(_BASE_ISSUE_LIST, ["issue"], params)
 
     def role_list(
         self: Session, params: dict[str, str | int] | None = None
@@ -498,13 +491,7 @@ class Session:
         Raises:
             ApiError: If there is an error in the API response data validation.
         """
-        resp = self._get_results(["role"], params)
-        adaptor = TypeAdapter(list[GenericItem])
-        try:
-            result = adaptor.validate_python(resp["results"])
-        except ValidationError as err:
-            raise exceptions.ApiError(err) from err
-        return result
+        return self._get_list(_GENERIC_ITEM_LIST, ["role"], params)
 
     def universe(self: Session, _id: int) -> Universe:
         """Retrieve information about a universe with the specified ID.
@@ -518,13 +505,7 @@ class Session:
         Raises:
             ApiError: If there is an error in the API response data validation.
         """
-        resp = self._call(["universe", _id])
-        adaptor = TypeAdapter(Universe)
-        try:
-            result = adaptor.validate_python(resp)
-        except ValidationError as error:
-            raise exceptions.ApiError(error) from error
-        return result
+        return self._get_item(Universe, ["universe", _id])
 
     def universes_list(
         self: Session, params: dict[str, str | int] | None = None
@@ -540,13 +521,7 @@ class Session:
         Raises:
             ApiError: If there is an error in the API response data validation.
         """
-        resp = self._get_results(["universe"], params)
-        adapter = TypeAdapter(list[BaseResource])
-        try:
-            result = adapter.validate_python(resp["results"])
-        except ValidationError as err:
-            raise exceptions.ApiError(err) from err
-        return result
+        return self._get_list(_BASE_RESOURCE_LIST, ["universe"], params)
 
     def imprint(self: Session, _id: int) -> Imprint:
         """Retrieves an imprint by ID.
@@ -560,13 +535,7 @@ class Session:
         Raises:
             ApiError: If there is an error during the API call or validation.
         """
-        resp = self._call(["imprint", _id])
-        adaptor = TypeAdapter(Imprint)
-        try:
-            result = adaptor.validate_python(resp)
-        except ValidationError as error:
-            raise exceptions.ApiError(error) from error
-        return result
+        return self._get_item(Imprint, ["imprint", _id])
 
     def imprints_list(
         self: Session, params: dict[str, str | int] | None = None
@@ -582,13 +551,53 @@ class Session:
         Raises:
             ApiError: If there is an error during the API call or validation.
         """
-        resp = self._get_results(["imprint"], params)
-        adapter = TypeAdapter(list[BaseResource])
+        return self._get_list(_BASE_RESOURCE_LIST, ["imprint"], params)
+
+    def _get_item(
+        self: Session, model: type[_ModelT], endpoint: list[str | int]
+    ) -> _ModelT:
+        """Retrieve a single resource from the specified API endpoint.
+
+        Args:
+            model: The schema to validate the response data with.
+            endpoint: A list of strings or integers representing the endpoint path.
+
+        Returns:
+            The validated resource.
+
+        Raises:
+            ApiError: If there is an error in the API response data validation.
+        """
+        resp = self._call(endpoint)
         try:
-            result = adapter.validate_python(resp["results"])
-        except ValidationError as err:
-            raise exceptions.ApiError(err) from err
-        return result
+            return model.model_validate(resp)
+        except ValidationError as error:
+            raise exceptions.ApiError(error) from error
+
+    def _get_list(
+        self: Session,
+        adapter: TypeAdapter[list[_ItemT]],
+        endpoint: list[str | int],
+        params: dict[str, str | int] | None = None,
+    ) -> list[_ItemT]:
+        """Retrieve every result from the specified API endpoint.
+
+        Args:
+            adapter: The TypeAdapter to validate the results with.
+            endpoint: A list of strings or integers representing the endpoint path.
+            params: A dictionary of parameters to be included in the request URL.
+
+        Returns:
+            A list of the validated results.
+
+        Raises:
+            ApiError: If there is an error in the API response data validation.
+        """
+        resp = self._get_results(endpoint, params)
+        try:
+            return adapter.validate_python(resp["results"])
+        except ValidationError as error:
+            raise exceptions.ApiError(error) from error
 
     def _get_results(
         self: Session,
@@ -613,51 +622,136 @@ class Session:
         return result
 
     def _retrieve_all_results(self: Session, data: dict[str, Any]) -> dict[str, Any]:
-        """Retrieve all results from paginated data by following the 'next' links.
+        """Retrieve all results from paginated data.
+
+        The number of pages is worked out from the first page, so the remaining
+        pages are requested concurrently rather than by following each 'next' link
+        in turn. If the first page is a stale cached copy, any counted page past
+        the current last page is skipped.
 
         Args:
             data: A dictionary containing the initial response data with pagination information.
 
         Returns:
-            A dictionary containing all results retrieved by following the pagination links.
+            A dictionary containing all results retrieved from the remaining pages.
         """
-        has_next_page = True
         next_page = data["next"]
+        # The first page needn't be page 1, if the caller asked for a later one.
+        start = int(parse_qs(urlsplit(next_page).query)["page"][0])
+        # The number of the last page. An empty first page gives no page size, so
+        # then just follow the 'next' links.
+        last_page = (
+            ceil(data["count"] / len(data["results"])) if data["results"] else start
+        )
+        urls = [next_page] + [
+            _page_url(next_page, page) for page in range(start + 1, last_page + 1)
+        ]
+
+        with ThreadPoolExecutor(max_workers=min(MAX_PAGE_WORKERS, len(urls))) as pool:
+            responses = list(pool.map(self._retrieve_counted_page, urls))
+
+        if None in responses:
+            # The first page was a stale copy, and results have been removed since.
+            responses = responses[: responses.index(None)]
+        else:
+            # Follow on if more results were added since the page count was taken.
+            while responses[-1]["next"]:
+                responses.append(self._retrieve_page(responses[-1]["next"]))
+
+        # Build a new dict, since the first page may be shared with the cache.
+        return {
+            **data,
+            "results": [
+                result
+                for response in (data, *responses)
+                for result in response["results"]
+            ],
+        }
 
-        while has_next_page:
-            if cached_response := self._get_results_from_cache(next_page):
-                data["results"].extend(cached_response["results"])
-                if cached_response["next"]:
-                    next_page = cached_response["next"]
-                else:
-                    has_next_page = False
-                continue
+    def _retrieve_counted_page(self: Session, url: str) -> dict[str, Any] | None:
+        """Retrieve a page worked out from the result count of the first page.
 
-            response = self._request_data(next_page)
-            data["results"].extend(response["results"])
+        Args:
+            url: A string representing the URL of the page.
 
-            self._save_results_to_cache(next_page, response)
+        Returns:
+            A dictionary containing the page's response data, or None if the page is
+            past the last one.
 
-            if response["next"]:
-                next_page = response["next"]
-            else:
-                has_next_page = False
+        Raises:
+            ApiError: If the API reports any other error.
+        """
+        try:
+            return self._retrieve_page(url)
+        except exceptions.ApiError as error:
+            if str(error) != INVALID_PAGE:
+                raise
+            return None
+
+    def _retrieve_page(self: Session, url: str) -> dict[str, Any]:
+        """Retrieve a single page of results from the cache or the API.
+
+        Args:
+            url: A string representing the URL of the page.
+
+        Returns:
+            A dictionary containing the page's response data.
+        """
+        if (cached_response := self._get_results_from_cache(url)) is not None:
+            return cached_response
+        return self._fetch(url, url)
+
+    def _fetch(
+        self: Session,
+        url: str,
+        cache_key: str,
+        params: dict[str, str | int] | None = None,
+    ) -> Any:
+        """Request data from the API and save it to the cache.
+
+        If the cache holds an expired copy with an ETag, the request is made
+        conditional and the cached copy is reused when the server reports it hasn't
+        changed.
+
+        Args:
+            url: A string representing the URL to send the request to.
+            cache_key: A string representing the key to cache the data with.
+            params: An optional dictionary of parameters to include in the request.
+
+        Returns:
+            The JSON response data from the request.
+
+        Raises:
+            ApiError: If the response data contains a 'detail' key indicating an error.
+        """
+        stale = self._get_stale_results_from_cache(cache_key)
+        data, etag = self._request_data(url, params, etag=stale[1] if stale else None)
+        if data is None:
+            data = stale[0]
+
+        if "detail" in data:
+            raise exceptions.ApiError(data["detail"])
+
+        self._save_results_to_cache(cache_key, data, etag)
 
         return data
 
-    @sleep_and_retry
-    @limits(calls=25, period=ONE_MINUTE)
     def _request_data(
-        self: Session, url: str, params: dict[str, str | int] | None = None
-    ) -> Any:
+        self: Session,
+        url: str,
+        params: dict[str, str | int] | None = None,
+        etag: str | None = None,
+    ) -> tuple[Any | None, str | None]:
         """Send a request to the specified URL with optional parameters and handles retries.
 
         Args:
             url: A string representing the URL to send the request to.
             params: An optional dictionary of parameters to include in the request.
+            etag: An optional ETag to send with ``If-None-Match``.
 
         Returns:
-            The JSON response data from the request.
+            A tuple of the JSON response data and the response's ETag. The data is
+            None if the server replied that the resource matching the ETag is unchanged.
 
         Raises:
             ApiError: If there is a connection error during the request.
@@ -665,21 +759,19 @@ class Session:
         if params is None:
             params = {}
 
+        headers = {"If-None-Match": etag} if etag else None
+
+        _RATE_LIMITER.acquire()
         try:
-            session = requests.Session()
-            retry = Retry(connect=3, backoff_factor=0.5)
-            session.mount("https://", HTTPAdapter(max_retries=retry))
-            response = session.get(
-                url,
-                params=params,
-                timeout=2.5,
-                auth=(self.username, self.passwd),
-                headers=self.header,
-            ).json()
+            response = self._session.get(
+                url, params=params, timeout=2.5, headers=headers
+            )
         except requests.exceptions.ConnectionError as e:
             raise exceptions.ApiError(f"Connection error: {e!r}") from e
 
-        return response
+        if response.status_code == requests.codes.not_modified:
+            return None, etag
+        return json_loads(response.content), response.headers.get("ETag")
 
     def _get_results_from_cache(self: Session, key: str) -> Any | None:
         """Retrieve cached response data using the specified key.
@@ -705,12 +797,32 @@ class Session:
 
         return cached_response
 
-    def _save_results_to_cache(self: Session, key: str, data: str) -> None:
+    def _get_stale_results_from_cache(
+        self: Session, key: str
+    ) -> tuple[Any, str] | None:
+        """Retrieve expired response data and its ETag using the specified key.
+
+        Caches without a ``get_stale`` method don't support revalidation, so None is
+        returned for them.
+
+        Args:
+            key: A string representing the key to retrieve cached data.
+
+        Returns:
+            A tuple of the cached response data and its ETag if available, or None.
+        """
+        get_stale = getattr(self.cache, "get_stale", None)
+        return get_stale(key) if get_stale else None
+
+    def _save_results_to_cache(
+        self: Session, key: str, data: str, etag: str | None = None
+    ) -> None:
         """Store the provided data in the cache using the specified key.
 
         Args:
             key: A string representing the key to store the data in the cache.
             data: The data to be stored in the cache.
+            etag: The ETag returned with the data, saved if the cache supports it.
 
         Returns:
             None
@@ -720,7 +832,10 @@ class Session:
         """
         if self.cache:
             try:
-                self.cache.store(key, data)
+                if etag and hasattr(self.cache, "get_stale"):
+                    self.cache.store(key, data, etag=etag)
+                else:
+                    self.cache.store(key, data)
             except AttributeError as e:
                 raise exceptions.CacheError(
                     f"Cache object passed in is missing attribute: {e!r}"
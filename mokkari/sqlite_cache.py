@@ -7,10 +7,125 @@ This module provides the following classes:
 
 from __future__ import annotations
 
-import json
+import queue
 import sqlite3
-from datetime import datetime, timedelta, timezone
-from typing import Any
+import threading
+import time
+import weakref
+import zlib
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Any
+
+from mokkari import exceptions
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+try:
+    from orjson import dumps as json_dumps, loads as json_loads
+except ImportError:  # pragma: no cover
+    import json
+
+    json_loads = json.loads
+
+    def json_dumps(value: Any) -> bytes:
+        """Serialize a value to UTF-8 encoded JSON."""
+        return json.dumps(value).encode("utf-8")
+
+
+# Bump this whenever the layout of the responses table changes.
+SCHEMA_VERSION = 3
+
+ONE_DAY = 86400
+
+# The most rows the writer thread commits in one transaction.
+WRITE_BATCH_SIZE = 100
+# The most rows cleanup() deletes in one transaction.
+CLEANUP_BATCH_SIZE = 1000
+# Encoded JSON larger than this many bytes is compressed before it is written.
+COMPRESS_THRESHOLD = 1024
+
+# An upsert updates a row in place, where INSERT OR REPLACE deletes it and inserts
+# a new one. Upserts need SQLite 3.24 or newer.
+if sqlite3.sqlite_version_info >= (3, 24, 0):
+    _STORE_SQL = (
+        "INSERT INTO responses(key, json, expire, etag) VALUES(?, ?, ?, ?) "
+        "ON CONFLICT(key) DO UPDATE SET "
+        "json = excluded.json, expire = excluded.expire, etag = excluded.etag"
+    )
+else:  # pragma: no cover
+    _STORE_SQL = (
+        "INSERT OR REPLACE INTO responses(key, json, expire, etag) VALUES(?, ?, ?, ?)"
+    )
+
+
+def _compress(data: bytes) -> bytes:
+    """Compress encoded JSON if it is large enough to be worth it."""
+    return zlib.compress(data) if len(data) > COMPRESS_THRESHOLD else data
+
+
+def _decompress(data: bytes | str) -> bytes | str:
+    """Decompress data written by _compress().
+
+    A zlib stream starts with 0x78 ("x"), which can't start a JSON document, so
+    compressed rows don't need a separate marker.
+    """
+    if isinstance(data, bytes) and data.startswith(b"x"):
+        return zlib.decompress(data)
+    return data
+
+
+def _write_rows(
+    con: sqlite3.Connection,
+    lock: threading.Lock,
+    rows: queue.Queue[list[tuple[str, bytes, int, str | None]] | None],
+    errors: list[sqlite3.Error],
+) -> None:
+    """Write queued rows to the database in batches, until None is queued.
+
+    This runs on a cache's writer thread. It is given the parts of the cache it
+    needs rather than the cache itself, so a cache that is no longer used can
+    still be garbage collected.
+    """
+    while True:
+        batches = [rows.get()]
+        size = len(batches[0] or ())
+        while batches[-1] is not None and size < WRITE_BATCH_SIZE:
+            try:
+                batches.append(rows.get_nowait())
+            except queue.Empty:
+                break
+            size += len(batches[-1] or ())
+        try:
+            with lock, con:
+                con.executemany(
+                    _STORE_SQL,
+                    (
+                        (key, _compress(data), expire, etag)
+                        for batch in batches
+                        if batch
+                        for key, data, expire, etag in batch
+                    ),
+                )
+        except sqlite3.Error as error:
+            # Keep writing later batches; the failure is reported by flush().
+            errors.append(error)
+        finally:
+            for _ in batches:
+                rows.task_done()
+        if batches[-1] is None:
+            return
+
+
+def _stop_writer(
+    rows: queue.Queue[list[tuple[str, bytes, int, str | None]] | None],
+    thread: threading.Thread,
+) -> None:
+    """Write any queued rows, then stop a cache's writer thread."""
+    rows.put(None)
+    # The thread can't wait for itself, if it is the one that collects the cache.
+    if thread is not threading.current_thread():
+        thread.join()
 
 
 class SqliteCache:
@@ -19,66 +134,380 @@ class SqliteCache:
     Methods:
         - __init__: Initializes a new SqliteCache.
         - get: Retrieve data from the cache database.
+        - get_raw: Retrieve data from the cache database without decoding it.
+        - get_stale: Retrieve expired data that can be revalidated with its ETag.
         - store: Save data to the cache database.
+        - store_raw: Save already encoded JSON to the cache database.
+        - store_many: Save several items to the cache database in one transaction.
+        - flush: Wait until all stored data has been written to the database.
+        - close: Write any pending data and close the database.
         - cleanup: Remove any expired data from the cache database.
-        - _determine_expire_str: Determine the expiration date string for cache data.
+        - _raise_write_error: Raise the last error the writer thread hit.
+        - _store_rows: Remember items in memory and queue them to be written.
+        - _start_writer: Start the thread that writes queued rows.
+        - _lookup: Find an item in memory or in the database.
+        - _remember: Keep data in the in-memory cache.
+        - _migrate: Create or upgrade the responses table.
+        - _determine_expire: Determine the expiration time for cache data.
     """
 
     def __init__(
         self: SqliteCache,
         db_name: str = "mokkari_cache.db",
         expire: int | None = None,
+        memory_size: int = 512,
     ) -> None:
-        """Initialize a new SqliteCache."""
+        """Initialize a new SqliteCache.
+
+        Args:
+            db_name: The path of the database file.
+            expire: The number of days data is kept, or None to keep it forever.
+            memory_size: The number of recently used rows kept in memory.
+        """
         self.expire = expire
-        self.con = sqlite3.connect(db_name)
-        self.cur = self.con.cursor()
-        self.cur.execute("CREATE TABLE IF NOT EXISTS responses (key, json, expire)")
+        # Recently used data, already decoded, so hot keys don't need a round trip
+        # to SQLite or the JSON decoder.
+        self.memory_size = memory_size
+        self._memory: OrderedDict[str, tuple[Any, int, str | None]] = OrderedDict()
+        # The connection is shared between threads, so every use of it is
+        # serialized through the lock.
+        # Write transactions take the write lock up front (BEGIN IMMEDIATE), so a
+        # batch never has to back out when another connection starts writing.
+        self.con = sqlite3.connect(
+            db_name, check_same_thread=False, isolation_level="IMMEDIATE"
+        )
+        self._lock = threading.Lock()
+        # WAL avoids an fsync of the rollback journal on every commit, and with it
+        # synchronous=NORMAL only syncs at checkpoints.
+        self.con.execute("PRAGMA journal_mode=WAL")
+        self.con.execute("PRAGMA synchronous=NORMAL")
+        self.con.execute("PRAGMA temp_store=MEMORY")
+        self.con.execute("PRAGMA mmap_size=134217728")
+        self._migrate()
         self.cleanup()
+        # Rows are written by a single background thread, so a burst of stores
+        # shares one commit instead of paying for one each.
+        self._queue: queue.Queue[list[tuple[str, bytes, int, str | None]] | None] = (
+            queue.Queue()
+        )
+        # Errors hit by writes, the last of which is raised by the next flush()
+        # or close().
+        self._write_errors: list[sqlite3.Error] = []
+        # The writer thread is only started once something is stored.
+        self._thread: threading.Thread | None = None
+        self._stop: weakref.finalize | None = None
 
     def get(self: SqliteCache, key: str) -> Any | None:
         """Retrieve data from the cache database.
 
+        Recently used data is returned from memory as the same object each time,
+        without a copy, so it must not be modified.
+
+        Args:
+            key: A string representing the value to search for.
+
+        Returns:
+            The retrieved data if found and not expired, or None otherwise.
+        """
+        with self._lock:
+            entry = self._lookup(key)
+            if entry is None or (self.expire and entry[1] < time.time()):
+                return None
+            value, expire, etag, encoded = entry
+            if encoded:
+                value = json_loads(value)
+                self._remember(key, (value, expire, etag))
+        return value
+
+    def get_raw(self: SqliteCache, key: str) -> bytes | None:
+        """Retrieve data from the cache database as encoded JSON, without decoding it.
+
+        Args:
+            key: A string representing the value to search for.
+
+        Returns:
+            The retrieved JSON if found and not expired, or None otherwise.
+        """
+        with self._lock:
+            entry = self._lookup(key)
+        if entry is None or (self.expire and entry[1] < time.time()):
+            return None
+        value, _, _, encoded = entry
+        if not encoded:
+            return json_dumps(value)
+        # Rows written by older versions hold the JSON as TEXT.
+        return value.encode("utf-8") if isinstance(value, str) else value
+
+    def get_stale(self: SqliteCache, key: str) -> tuple[Any, str] | None:
+        """Retrieve data stored with an ETag, even if it has expired.
+
+        The ETag can be sent to the server with ``If-None-Match`` so an unchanged
+        resource doesn't have to be downloaded again.
+
+        Data that is still waiting to be written is found as well, so no flush()
+        is needed first.
+
         Args:
             key: A string representing the value to search for.
 
         Returns:
-            The retrieved data if found, or None if not found.
+            A tuple of the data and its ETag if found, or None if not found.
         """
-        self.cur.execute("SELECT json FROM responses WHERE key = ?", (key,))
-        return json.loads(result[0]) if (result := self.cur.fetchone()) else None
+        with self._lock:
+            entry = self._lookup(key)
+            if entry is None or entry[2] is None:
+                return None
+            value, expire, etag, encoded = entry
+            if encoded:
+                value = json_loads(value)
+                self._remember(key, (value, expire, etag))
+        return value, etag
 
-    def store(self: SqliteCache, key: str, value: str) -> None:
+    def store(self: SqliteCache, key: str, value: str, etag: str | None = None) -> None:
         """Save data to the cache database.
 
+        The data is available from get() straight away, and written to the
+        database in the background. Use flush() to wait for the write. The object
+        itself is kept in memory and returned by later calls to get(), so it must
+        not be modified once stored.
+
         Args:
             key: A string representing the item id.
             value: The data to be saved.
+            etag: The ETag the server returned for the data, if any.
+
+        Returns:
+            None
+        """
+        self._store_rows([(key, value, etag)])
+
+    def store_raw(
+        self: SqliteCache, key: str, payload: bytes, etag: str | None = None
+    ) -> None:
+        """Save already encoded JSON to the cache database, without encoding it again.
+
+        The JSON is only decoded if it is later read with get().
+
+        Args:
+            key: A string representing the item id.
+            payload: The encoded JSON to be saved.
+            etag: The ETag the server returned for the data, if any.
 
         Returns:
             None
+
+        Raises:
+            CacheError: If the payload starts with "x", which JSON never does and
+                which marks compressed rows in the database.
         """
-        self.cur.execute(
-            "INSERT INTO responses(key, json, expire) VALUES(?, ?, ?)",
-            (key, json.dumps(value), self._determine_expire_str()),
+        if payload.startswith(b"x"):
+            msg = f"Payload for {key!r} is not encoded JSON."
+            raise exceptions.CacheError(msg)
+        self._store_rows([(key, payload, etag)])
+
+    def store_many(self: SqliteCache, items: Iterable[tuple[str, Any]]) -> None:
+        """Save several items to the cache database in one transaction.
+
+        This is meant for warming the cache with a large number of items, which
+        would otherwise be committed in batches alongside other stores. As with
+        store(), the data must not be modified once stored.
+
+        Args:
+            items: Pairs of a string representing the item id and the data to be saved.
+
+        Returns:
+            None
+        """
+        self._store_rows((key, value, None) for key, value in items)
+
+    def _store_rows(
+        self: SqliteCache, items: Iterable[tuple[str, Any, str | None]]
+    ) -> None:
+        """Remember items in memory and queue them to be written in one transaction.
+
+        Args:
+            items: Tuples of the item id, the data or its encoded JSON, and its ETag.
+        """
+        expire = self._determine_expire()
+        # Encode everything before taking the lock, so an iterable that uses the
+        # cache can't deadlock, and one that fails leaves memory and disk alone.
+        entries = list(items)
+        rows = [
+            (
+                key,
+                value if isinstance(value, bytes) else json_dumps(value),
+                expire,
+                etag,
+            )
+            for key, value, etag in entries
+        ]
+        with self._lock:
+            if self._thread is None:
+                self._start_writer()
+            for key, value, etag in entries:
+                self._remember(key, (value, expire, etag))
+            self._queue.put(rows)
+
+    def _start_writer(self: SqliteCache) -> None:
+        """Start the thread that writes queued rows. The caller must hold the lock."""
+        self._thread = threading.Thread(
+            target=_write_rows,
+            args=(self.con, self._lock, self._queue, self._write_errors),
+            daemon=True,
         )
-        self.con.commit()
+        self._thread.start()
+        # Stop the thread once the cache is closed or garbage collected, or when
+        # the interpreter exits. Unlike an atexit hook, this doesn't keep the
+        # cache alive.
+        self._stop = weakref.finalize(self, _stop_writer, self._queue, self._thread)
+
+    def flush(self: SqliteCache) -> None:
+        """Wait until all stored data has been written to the database.
+
+        Raises:
+            CacheError: If any data couldn't be written since the last flush.
+        """
+        # Once the cache is closed nothing drains the queue, so don't wait on it.
+        if self._thread is not None and self._thread.is_alive():
+            self._queue.join()
+        self._raise_write_error()
 
-    def cleanup(self: SqliteCache) -> None:
-        """Remove any expired data from the cache database."""
+    def close(self: SqliteCache) -> None:
+        """Write any pending data and close the database.
+
+        Raises:
+            CacheError: If any data couldn't be written since the last flush.
+        """
+        if self._stop is not None:
+            self._stop()
+        self.con.close()
+        self._raise_write_error()
+
+    def cleanup(self: SqliteCache) -> int:
+        """Remove any expired data from the cache database.
+
+        Data stored with an ETag is kept for another expiry period, so it can
+        still be revalidated instead of downloaded again. Rows are deleted in
+        small batches, so the write lock is never held for long.
+
+        Returns:
+            The number of rows removed.
+        """
         if not self.expire:
+            return 0
+        now = int(time.time())
+        removed = 0
+        while True:
+            with self._lock, self.con:
+                deleted = self.con.execute(
+                    "DELETE FROM responses WHERE rowid IN ("
+                    "SELECT rowid FROM responses "
+                    "WHERE expire < ? AND (etag IS NULL OR expire < ?) "
+                    "ORDER BY expire LIMIT ?)",
+                    (now, now - self.expire * ONE_DAY, CLEANUP_BATCH_SIZE),
+                ).rowcount
+            removed += deleted
+            if deleted < CLEANUP_BATCH_SIZE:
+                return removed
+
+    def _raise_write_error(self: SqliteCache) -> None:
+        """Raise the last error the writer thread hit, if any, and clear it.
+
+        Raises:
+            CacheError: If any data couldn't be written since the last call.
+        """
+        if self._write_errors:
+            error = self._write_errors[-1]
+            self._write_errors.clear()
+            msg = f"Failed to write to the cache database: {error!r}"
+            raise exceptions.CacheError(msg) from error
+
+    def _lookup(
+        self: SqliteCache, key: str
+    ) -> tuple[Any, int, str | None, bool] | None:
+        """Find an item in memory or in the database, whether or not it has expired.
+
+        The caller must hold the lock.
+
+        Returns:
+            A tuple of the data, its expiration time, its ETag and whether the data
+            is still encoded JSON, or None if not found.
+        """
+        if (entry := self._memory.get(key)) is not None:
+            self._memory.move_to_end(key)
+            # Decoded JSON is never bytes, so bytes are JSON from store_raw().
+            return (*entry, isinstance(entry[0], bytes))
+        row = self.con.execute(
+            "SELECT json, expire, etag FROM responses WHERE key = ?", (key,)
+        ).fetchone()
+        return (_decompress(row[0]), row[1], row[2], True) if row else None
+
+    def _remember(
+        self: SqliteCache, key: str, entry: tuple[Any, int, str | None]
+    ) -> None:
+        """Keep data in the in-memory cache, evicting the least recently used.
+
+        Data saved with store_raw() is kept encoded until get() first decodes it.
+        The caller must hold the lock.
+        """
+        self._memory[key] = entry
+        self._memory.move_to_end(key)
+        if len(self._memory) > self.memory_size:
+            self._memory.popitem(last=False)
+
+    def _migrate(self: SqliteCache) -> None:
+        """Create the responses table, upgrading a cache made by an older version."""
+        version = self.con.execute("PRAGMA user_version").fetchone()[0]
+        if version == SCHEMA_VERSION:
             return
-        self.cur.execute(
-            "DELETE FROM responses WHERE expire < ?;",
-            (datetime.now(tz=timezone.utc).strftime("%Y-%m-%d"),),
+
+        table = (
+            "CREATE TABLE responses "
+            "(key TEXT PRIMARY KEY, json BLOB, expire INTEGER, etag TEXT);"
         )
-        self.con.commit()
-
-    def _determine_expire_str(self: SqliteCache) -> str:
-        """Determine the expiration date string for cache data."""
-        dt = (
-            datetime.now(tz=timezone.utc) + timedelta(days=self.expire)
-            if self.expire
-            else datetime.now(tz=timezone.utc)
+        rebuild = bool(
+            self.con.execute(
+                "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'responses'"
+            ).fetchone()
         )
-        return dt.strftime("%Y-%m-%d")
+        if rebuild:
+            # Older caches are rebuilt: before version 1 the table was un-keyed and
+            # may hold duplicate keys, before version 2 it had no etag column, and
+            # before version 3 expiry was stored as a YYYY-MM-DD string. A row
+            # expired once its date had passed, so it now expires at the end of it.
+            # A date that can't be parsed is treated as long expired.
+            etag = "etag" if version >= 2 else "NULL"  # noqa: PLR2004
+            steps = [
+                "ALTER TABLE responses RENAME TO responses_old;",
+                table,
+                f"""
+                INSERT OR REPLACE INTO responses(key, json, expire, etag)
+                    SELECT key, json,
+                        COALESCE(
+                            CAST(strftime('%s', expire) AS INTEGER) + {ONE_DAY}, 0
+                        ),
+                        {etag}
+                    FROM responses_old ORDER BY rowid;
+                DROP TABLE responses_old;
+                """,
+            ]
+        else:
+            steps = [table]
+
+        migration = "\n".join(steps)
+        self.con.executescript(
+            f"""
+            BEGIN;
+            {migration}
+            CREATE INDEX IF NOT EXISTS idx_responses_expire ON responses(expire);
+            PRAGMA user_version = {SCHEMA_VERSION};
+            COMMIT;
+            """
+        )
+        if rebuild:
+            # Reclaim the pages left behind by the copied table.
+            self.con.execute("VACUUM")
+
+    def _determine_expire(self: SqliteCache) -> int:
+        """Determine the expiration time for cache data, in seconds since the epoch."""
+        return int(time.time()) + (self.expire or 0) * ONE_DAY
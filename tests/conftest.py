@@ -4,12 +4,18 @@ This module contains pytest fixtures.
 """
 
 import os
+from collections.abc import Iterator
+from pathlib import Path
 
 import pytest
 
 from mokkari import api, sqlite_cache
 from mokkari.session import Session
 
+# Resolved from this file, so the recorded responses are found whatever directory
+# pytest is started from.
+TESTING_CACHE = Path(__file__).parent / "testing_mock.sqlite"
+
 
 @pytest.fixture(scope="session")
 def dummy_username() -> str:
@@ -24,10 +30,9 @@ def dummy_password() -> str:
 
 
 @pytest.fixture(scope="session")
-def talker(dummy_username: str, dummy_password: str) -> Session:
-    """Mokkari api fixture."""
-    return api(
-        username=dummy_username,
-        passwd=dummy_password,
-        cache=sqlite_cache.SqliteCache("tests/testing_mock.sqlite"),
-    )
+def talker(dummy_username: str, dummy_password: str) -> Iterator[Session]:
+    """Mokkari api fixture, sharing one cache connection for the whole session."""
+    cache = sqlite_cache.SqliteCache(str(TESTING_CACHE))
+    with api(username=dummy_username, passwd=dummy_password, cache=cache) as session:
+        yield session
+    cache.close()
@@ -7,11 +7,22 @@ import json
 from datetime import date, datetime, timedelta, timezone
 
 import pytest
-import requests_mock
+from requests_mock import Mocker
 
 from mokkari import exceptions
 from mokkari.session import Session
 
+WITCHING_HOUR_MODIFIED = datetime(
+    2019,
+    6,
+    23,
+    15,
+    13,
+    19,
+    507207,
+    tzinfo=timezone(timedelta(days=-1, seconds=72000), "-0400"),
+)
+
 
 def test_known_arc(talker: Session) -> None:
     """Test for known arcs."""
@@ -21,16 +32,7 @@ def test_known_arc(talker: Session) -> None:
         witching.image.__str__()
         == "https://static.metron.cloud/media/arc/2018/11/13/witching-hour.jpg"
     )
-    assert witching.modified == datetime(
-        2019,
-        6,
-        23,
-        15,
-        13,
-        19,
-        507207,
-        tzinfo=timezone(timedelta(days=-1, seconds=72000), "-0400"),
-    )
+    assert witching.modified == WITCHING_HOUR_MODIFIED
     assert witching.resource_url.__str__() == "https://metron.cloud/arc/witching-hour/"
 
 
@@ -55,19 +57,18 @@ def test_arc_issue_list(talker: Session) -> None:
     assert issues[0].cover_date == date(2011, 11, 1)
 
 
-def test_bad_arc(talker: Session) -> None:
+def test_bad_arc(talker: Session, requests_mock: Mocker) -> None:
     """Test for bad arc requests."""
-    with requests_mock.Mocker() as r:
-        r.get(
-            "https://metron.cloud/api/arc/-8/",
-            text='{"response_code": 404, "detail": "Not found."}',
-        )
+    requests_mock.get(
+        "https://metron.cloud/api/arc/-8/",
+        text='{"response_code": 404, "detail": "Not found."}',
+    )
 
-        with pytest.raises(exceptions.ApiError):
-            talker.arc(-8)
+    with pytest.raises(exceptions.ApiError):
+        talker.arc(-8)
 
 
-def test_bad_arc_validate(talker: Session) -> None:
+def test_bad_arc_validate(talker: Session, requests_mock: Mocker) -> None:
     """Test data with invalid data."""
     # Change the 'name' field to an int, when it should be a string.
     data = {
@@ -77,11 +78,10 @@ def test_bad_arc_validate(talker: Session) -> None:
         "image": "https://static.metron.cloud/media/arc/2018/11/25/ff-26.jpg",
         "modified": "2019-06-23T15:13:19.432378-04:00",
     }
-    with requests_mock.Mocker() as r:
-        r.get(
-            "https://metron.cloud/api/arc/500/",
-            text=json.dumps(data),
-        )
-
-        with pytest.raises(exceptions.ApiError):
-            talker.arc(500)
+    requests_mock.get(
+        "https://metron.cloud/api/arc/500/",
+        text=json.dumps(data),
+    )
+
+    with pytest.raises(exceptions.ApiError):
+        talker.arc(500)
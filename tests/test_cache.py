@@ -5,10 +5,22 @@ This module contains tests for SqliteCache objects.
 
 from __future__ import annotations
 
+import gc
+import sqlite3
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from typing import TYPE_CHECKING
+
 import pytest
-import requests_mock
 
-from mokkari import api, exceptions
+from mokkari import api, exceptions, sqlite_cache
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterator
+    from pathlib import Path
+
+    from requests_mock import Mocker
 
 
 class NoGet:
@@ -28,6 +40,21 @@ class NoStore:
         return
 
 
+@pytest.fixture
+def make_cache() -> Iterator[Callable[..., sqlite_cache.SqliteCache]]:
+    """Create SqliteCache objects that are closed when the test finishes."""
+    caches = []
+
+    def make(*args: object, **kwargs: object) -> sqlite_cache.SqliteCache:
+        cache = sqlite_cache.SqliteCache(*args, **kwargs)
+        caches.append(cache)
+        return cache
+
+    yield make
+    for cache in caches:
+        cache.close()
+
+
 def test_no_get(dummy_username: str, dummy_password: str) -> None:
     """Test for retrieving failure."""
     m = api(username=dummy_username, passwd=dummy_password, cache=NoGet())
@@ -36,18 +63,372 @@ def test_no_get(dummy_username: str, dummy_password: str) -> None:
         m.series(5)
 
 
-def test_no_store(dummy_username: str, dummy_password: str) -> None:
+def test_no_store(
+    dummy_username: str, dummy_password: str, requests_mock: Mocker
+) -> None:
     """Test for saving data error."""
     m = api(username=dummy_username, passwd=dummy_password, cache=NoStore())
 
-    with requests_mock.Mocker() as r:
-        r.get(
-            "https://metron.cloud/api/series/5/",
-            text='{"response_code": 200}',
-        )
+    requests_mock.get(
+        "https://metron.cloud/api/series/5/",
+        text='{"response_code": 200}',
+    )
+
+    with pytest.raises(exceptions.CacheError):
+        m.series(5)
+
+
+def test_sql_store_and_get(make_cache: Callable[..., sqlite_cache.SqliteCache]) -> None:
+    """Test for saving and retrieving data from the sqlite cache."""
+    cache = make_cache(":memory:")
+    url = "https://metron.cloud/api/series/1/"
+    data = {"id": 1, "name": "Foo", "results": [1, 2, 3]}
+
+    assert cache.get(url) is None
+    cache.store(url, data)
+    assert cache.get(url) == data
+
+
+def test_sql_store_replaces_key(
+    make_cache: Callable[..., sqlite_cache.SqliteCache],
+) -> None:
+    """Test that storing an existing key replaces the cached data."""
+    cache = make_cache(":memory:")
+    url = "https://metron.cloud/api/series/1/"
+
+    cache.store(url, {"name": "Foo"})
+    cache.store(url, {"name": "Bar"})
+    cache.flush()
+    assert cache.get(url) == {"name": "Bar"}
+    assert cache.con.execute("SELECT COUNT(*) FROM responses").fetchone()[0] == 1
+
+
+def test_sql_memory_cache(make_cache: Callable[..., sqlite_cache.SqliteCache]) -> None:
+    """Test that recently used data is served from memory."""
+    cache = make_cache(":memory:", memory_size=2)
+    for i in range(3):
+        cache.store(f"key-{i}", {"id": i})
+    cache.flush()
+
+    assert list(cache._memory) == ["key-1", "key-2"]
+    assert cache.get("key-0") == {"id": 0}
+    assert list(cache._memory) == ["key-2", "key-0"]
+
+    # Served from memory even once the database row is gone.
+    cache.con.execute("DELETE FROM responses")
+    assert cache.get("key-2") == {"id": 2}
+    assert cache.get("key-1") is None
+
+
+def test_sql_memory_cache_skips_decoding(
+    make_cache: Callable[..., sqlite_cache.SqliteCache],
+) -> None:
+    """Test that data served from memory is not decoded again."""
+    cache = make_cache(":memory:")
+    value = {"id": 1}
+    cache.store("key", value)
+
+    assert cache.get("key") is value
+    assert cache.get("key") is cache.get("key")
+
+
+def test_cached_pages_are_not_mutated(
+    dummy_username: str,
+    dummy_password: str,
+    requests_mock: Mocker,
+    make_cache: Callable[..., sqlite_cache.SqliteCache],
+) -> None:
+    """Test that joining result pages leaves the cached first page unchanged."""
+    m = api(
+        username=dummy_username,
+        passwd=dummy_password,
+        cache=make_cache(":memory:"),
+    )
+    url = "https://metron.cloud/api/role/"
+    roles = [{"id": i, "name": f"Role {i}"} for i in range(3)]
+
+    requests_mock.get(
+        f"{url}?name=e",
+        complete_qs=True,
+        json={"count": 3, "next": f"{url}?name=e&page=2", "results": roles[:2]},
+    )
+    requests_mock.get(
+        f"{url}?name=e&page=2",
+        complete_qs=True,
+        json={"count": 3, "next": None, "results": roles[2:]},
+    )
+
+    assert len(m.role_list({"name": "e"})) == 3
+    assert len(m.role_list({"name": "e"})) == 3
+
+
+def test_sql_store_and_get_raw(
+    make_cache: Callable[..., sqlite_cache.SqliteCache],
+) -> None:
+    """Test saving and reading encoded JSON without decoding it."""
+    cache = make_cache(":memory:")
+    cache.store_raw("raw", b'{"id": 1}')
+    cache.store("value", {"id": 2})
+
+    assert cache.get_raw("raw") == b'{"id": 1}'
+    assert cache.get("raw") == {"id": 1}
+    assert sqlite_cache.json_loads(cache.get_raw("value")) == {"id": 2}
+
+    cache.flush()
+    cache._memory.clear()
+    assert cache.get_raw("raw") == b'{"id": 1}'
+    assert cache.get_raw("missing") is None
+
+
+def test_sql_store_raw_rejects_compression_marker(
+    make_cache: Callable[..., sqlite_cache.SqliteCache],
+) -> None:
+    """Test that raw data which would be mistaken for a compressed row is refused."""
+    cache = make_cache(":memory:")
+    with pytest.raises(exceptions.CacheError):
+        cache.store_raw("raw", b"xyz")
+
+    assert cache.get_raw("raw") is None
+
+
+def test_sql_compress_large_values(
+    make_cache: Callable[..., sqlite_cache.SqliteCache],
+) -> None:
+    """Test that large values are compressed in the database."""
+    cache = make_cache(":memory:")
+    large = {"desc": "Spider-Man " * 200}
+    cache.store("large", large, etag='"abc"')
+    cache.store("small", {"id": 1})
+    cache.flush()
+    cache._memory.clear()
+
+    data = dict(cache.con.execute("SELECT key, json FROM responses").fetchall())
+    assert data["large"].startswith(b"x")
+    assert len(data["large"]) < sqlite_cache.COMPRESS_THRESHOLD
+    assert data["small"] == sqlite_cache.json_dumps({"id": 1})
+    assert cache.get("large") == large
+    assert cache.get_raw("large") == sqlite_cache.json_dumps(large)
+    assert cache.get_stale("large") == (large, '"abc"')
+
+
+def test_sql_store_many(make_cache: Callable[..., sqlite_cache.SqliteCache]) -> None:
+    """Test saving several items at once."""
+    cache = make_cache(":memory:")
+    cache.store_many((f"key-{i}", {"id": i}) for i in range(150))
+    cache.flush()
+
+    assert cache.con.execute("SELECT COUNT(*) FROM responses").fetchone()[0] == 150
+    assert cache.get("key-0") == {"id": 0}
+    assert cache.get("key-149") == {"id": 149}
+
+
+def test_sql_store_many_from_cache(
+    make_cache: Callable[..., sqlite_cache.SqliteCache],
+) -> None:
+    """Test saving items from a generator that reads the cache itself."""
+    cache = make_cache(":memory:")
+    cache.store("key-0", {"id": 0})
+    cache.store_many(
+        (f"key-{i}", {"id": i, "first": cache.get("key-0")}) for i in range(1, 3)
+    )
+
+    assert cache.get("key-2") == {"id": 2, "first": {"id": 0}}
+
+
+def test_sql_store_many_failure_stores_nothing(
+    make_cache: Callable[..., sqlite_cache.SqliteCache],
+) -> None:
+    """Test that an item that can't be encoded leaves the cache unchanged."""
+    cache = make_cache(":memory:")
+    with pytest.raises(TypeError):
+        cache.store_many([("good", {"id": 1}), ("bad", {"id": object()})])
+    cache.flush()
+
+    assert cache.get("good") is None
+    assert cache.con.execute("SELECT COUNT(*) FROM responses").fetchone()[0] == 0
+
+
+def test_sql_cleanup_in_batches(
+    monkeypatch: pytest.MonkeyPatch, make_cache: Callable[..., sqlite_cache.SqliteCache]
+) -> None:
+    """Test that cleanup removes every expired row, a batch at a time."""
+    monkeypatch.setattr(sqlite_cache, "CLEANUP_BATCH_SIZE", 10)
+    cache = make_cache(":memory:", expire=1)
+    cache.store_many((f"key-{i}", {"id": i}) for i in range(25))
+    cache.store("etag", {"id": "etag"}, etag='"abc"')
+    cache.store("fresh", {"id": "fresh"})
+    cache.flush()
+    cache.con.execute("UPDATE responses SET expire = 0 WHERE key != 'fresh'")
+
+    assert cache.cleanup() == 26
+    assert cache.con.execute("SELECT key FROM responses").fetchall() == [("fresh",)]
+
+
+def test_sql_close_writes_pending_rows(
+    tmp_path: Path, make_cache: Callable[..., sqlite_cache.SqliteCache]
+) -> None:
+    """Test that closing the cache writes every queued row."""
+    db = str(tmp_path / "cache.sqlite")
+    cache = make_cache(db)
+    for i in range(250):
+        cache.store(f"key-{i}", {"id": i})
+    cache.close()
+
+    cache = make_cache(db)
+    assert cache.con.execute("SELECT COUNT(*) FROM responses").fetchone()[0] == 250
+    assert cache.get("key-249") == {"id": 249}
+    cache.close()
+
+
+def test_sql_failed_write_is_reported(
+    tmp_path: Path, make_cache: Callable[..., sqlite_cache.SqliteCache]
+) -> None:
+    """Test that a failed write is raised by flush() and later writes still run."""
+    db = str(tmp_path / "locked.sqlite")
+    cache = make_cache(db)
+    cache.con.execute("PRAGMA busy_timeout = 0")
+    other = sqlite3.connect(db, isolation_level=None)
+    other.execute("BEGIN IMMEDIATE")
+
+    cache.store("key", {"id": 1})
+    with pytest.raises(exceptions.CacheError):
+        cache.flush()
+
+    other.rollback()
+    other.close()
+    cache.store("key", {"id": 2})
+    cache.flush()
+    cache.close()
+    cache.flush()
+
+    cache = make_cache(db)
+    assert cache.get("key") == {"id": 2}
+    cache.close()
+
+
+def test_sql_threaded_access(
+    make_cache: Callable[..., sqlite_cache.SqliteCache],
+) -> None:
+    """Test using one cache from several threads."""
+    cache = make_cache(":memory:")
+
+    def store_and_get(i: int) -> dict[str, int]:
+        url = f"https://metron.cloud/api/issue/{i}/"
+        cache.store(url, {"id": i})
+        return cache.get(url)
+
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        results = list(pool.map(store_and_get, range(20)))
+
+    assert results == [{"id": i} for i in range(20)]
+
+
+def test_sql_journal_mode(
+    tmp_path: Path, make_cache: Callable[..., sqlite_cache.SqliteCache]
+) -> None:
+    """Test that file backed caches use write-ahead logging."""
+    cache = make_cache(str(tmp_path / "wal.sqlite"))
+    assert cache.con.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+
+
+def test_etag_revalidation(
+    dummy_username: str,
+    dummy_password: str,
+    requests_mock: Mocker,
+    make_cache: Callable[..., sqlite_cache.SqliteCache],
+) -> None:
+    """Test reusing expired cache data when the server reports it unchanged."""
+    cache = make_cache(":memory:", expire=1)
+    m = api(username=dummy_username, passwd=dummy_password, cache=cache)
+    url = "https://metron.cloud/api/publisher/1/"
+
+    requests_mock.get(url, json={"id": 1}, headers={"ETag": '"abc"'})
+    assert m._call(["publisher", 1]) == {"id": 1}
+
+    cache.flush()
+    cache.con.execute("UPDATE responses SET expire = 0")
+    cache._memory.clear()
+    assert cache.get(url) is None
+    assert cache.get_stale(url) == ({"id": 1}, '"abc"')
+
+    requests_mock.get(url, status_code=304)
+    assert m._call(["publisher", 1]) == {"id": 1}
+    assert requests_mock.last_request.headers["If-None-Match"] == '"abc"'
+
+    assert cache.get(url) == {"id": 1}
+
+
+def test_sql_get_stale_before_write(
+    make_cache: Callable[..., sqlite_cache.SqliteCache],
+) -> None:
+    """Test that data stored with an ETag can be revalidated before it is written."""
+    cache = make_cache(":memory:")
+    cache.store("etag", {"id": 1}, etag='"abc"')
+    cache.store("plain", {"id": 2})
+
+    assert cache.get_stale("etag") == ({"id": 1}, '"abc"')
+    assert cache.get_stale("plain") is None
+    assert cache.get_stale("missing") is None
+
+
+def test_sql_migrate_legacy_table(
+    tmp_path: Path, make_cache: Callable[..., sqlite_cache.SqliteCache]
+) -> None:
+    """Test upgrading a cache created without a primary key."""
+    db = tmp_path / "legacy.sqlite"
+    con = sqlite3.connect(db)
+    con.execute("CREATE TABLE responses (key, json, expire)")
+    con.executemany(
+        "INSERT INTO responses VALUES(?, ?, ?)",
+        [
+            ("foo", '{"name": "Old"}', "2024-09-27"),
+            ("bar", '{"name": "Bar"}', "2024-09-27"),
+            ("foo", '{"name": "New"}', "2024-09-27"),
+        ],
+    )
+    con.commit()
+    con.close()
+
+    cache = make_cache(str(db))
+    assert cache.get("foo") == {"name": "New"}
+    assert cache.get("bar") == {"name": "Bar"}
+    assert cache.con.execute("SELECT COUNT(*) FROM responses").fetchone()[0] == 2
+    # The expiry date becomes the end of that day, in seconds since the epoch.
+    assert cache.con.execute(
+        "SELECT expire FROM responses WHERE key = 'foo'"
+    ).fetchone()[0] == int(datetime(2024, 9, 28, tzinfo=timezone.utc).timestamp())
+    assert (
+        cache.con.execute("PRAGMA user_version").fetchone()[0]
+        == sqlite_cache.SCHEMA_VERSION
+    )
+
+
+def test_sql_migrate_malformed_expire(
+    tmp_path: Path, make_cache: Callable[..., sqlite_cache.SqliteCache]
+) -> None:
+    """Test that a legacy row with an unreadable expiry date is treated as expired."""
+    db = tmp_path / "legacy.sqlite"
+    con = sqlite3.connect(db)
+    con.execute("CREATE TABLE responses (key, json, expire)")
+    con.execute("INSERT INTO responses VALUES('foo', '{\"name\": \"Foo\"}', 'never')")
+    con.commit()
+    con.close()
+
+    cache = make_cache(str(db), expire=1)
+    assert cache.get("foo") is None
+    assert cache.con.execute("SELECT COUNT(*) FROM responses").fetchone()[0] == 0
+
+
+def test_sql_unused_cache_is_released() -> None:
+    """Test that a cache that is dropped without closing stops its writer thread."""
+    threads = threading.active_count()
+    for i in range(5):
+        cache = sqlite_cache.SqliteCache(":memory:")
+        cache.store("key", {"id": i})
+    del cache
+    gc.collect()
 
-        with pytest.raises(exceptions.CacheError):
-            m.series(5)
+    assert threading.active_count() == threads
 
 
 # def test_sql_store(dummy_username: str, dummy_password: str) -> None:
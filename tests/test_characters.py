@@ -7,12 +7,43 @@ import json
 from datetime import date, datetime, timedelta, timezone
 
 import pytest
-import requests_mock
+from requests_mock import Mocker
 
 from mokkari import exceptions
 from mokkari.schemas.character import Character
 from mokkari.session import Session
 
+BLACK_BOLT_MODIFIED = datetime(
+    2024,
+    1,
+    28,
+    13,
+    25,
+    35,
+    568293,
+    tzinfo=timezone(timedelta(days=-1, seconds=72000), "-0400"),
+)
+
+# Change the 'name' field to an int, when it should be a string.
+BAD_CHARACTER = json.dumps(
+    {
+        "id": 150,
+        "name": 50,
+        "alias": [],
+        "desc": "Foo",
+        "image": "https://static.metron.cloud/media/character/2018/11/15/moon-knight.jpg",
+        "creators": [
+            {
+                "id": 146,
+                "name": "Doug Moench",
+                "modified": "2019-06-23T15:13:21.994966-04:00",
+            }
+        ],
+        "teams": [],
+        "modified": "2020-07-29T17:48:36.347982-04:00",
+    }
+)
+
 
 def test_no_alias(talker: Session) -> None:
     """Test for no alias attribute."""
@@ -36,16 +67,7 @@ def test_known_character(talker: Session) -> None:
     )
     assert len(black_bolt.creators) == 2
     assert len(black_bolt.teams) == 3
-    assert black_bolt.modified == datetime(
-        2024,
-        1,
-        28,
-        13,
-        25,
-        35,
-        568293,
-        tzinfo=timezone(timedelta(days=-1, seconds=72000), "-0400"),
-    )
+    assert black_bolt.modified == BLACK_BOLT_MODIFIED
     assert any(item.name == "Earth 616" for item in black_bolt.universes)
     assert (
         black_bolt.resource_url.__str__()
@@ -73,42 +95,22 @@ def test_character_issue_list(talker: Session) -> None:
     assert issues[0].cover_date == date(1965, 12, 1)
 
 
-def test_bad_character(talker: Session) -> None:
+def test_bad_character(talker: Session, requests_mock: Mocker) -> None:
     """Test for a non-existing character."""
-    with requests_mock.Mocker() as r:
-        r.get(
-            "https://metron.cloud/api/character/-1/",
-            text='{"response_code": 404, "detail": "Not found."}',
-        )
-        with pytest.raises(exceptions.ApiError):
-            talker.character(-1)
+    requests_mock.get(
+        "https://metron.cloud/api/character/-1/",
+        text='{"response_code": 404, "detail": "Not found."}',
+    )
+    with pytest.raises(exceptions.ApiError):
+        talker.character(-1)
 
 
-def test_bad_character_validate(talker: Session) -> None:
+def test_bad_character_validate(talker: Session, requests_mock: Mocker) -> None:
     """Test data with invalid data."""
-    # Change the 'name' field to an int, when it should be a string.
-    data = {
-        "id": 150,
-        "name": 50,
-        "alias": [],
-        "desc": "Foo",
-        "image": "https://static.metron.cloud/media/character/2018/11/15/moon-knight.jpg",
-        "creators": [
-            {
-                "id": 146,
-                "name": "Doug Moench",
-                "modified": "2019-06-23T15:13:21.994966-04:00",
-            }
-        ],
-        "teams": [],
-        "modified": "2020-07-29T17:48:36.347982-04:00",
-    }
-
-    with requests_mock.Mocker() as r:
-        r.get(
-            "https://metron.cloud/api/character/150/",
-            text=json.dumps(data),
-        )
+    requests_mock.get(
+        "https://metron.cloud/api/character/150/",
+        text=BAD_CHARACTER,
+    )
 
-        with pytest.raises(exceptions.ApiError):
-            talker.character(150)
+    with pytest.raises(exceptions.ApiError):
+        talker.character(150)
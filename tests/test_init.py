@@ -6,20 +6,21 @@ This module contains tests for project init.
 
 import pytest
 
-from mokkari import api, exceptions, session
+from mokkari import api, exceptions, session, sqlite_cache
 
 
-def test_api() -> None:
-    """Test for api()."""
-    with pytest.raises(exceptions.AuthenticationError):
-        api()
-
+@pytest.mark.parametrize(
+    ("username", "passwd"),
+    [(None, None), (None, "Something"), ("Something", None)],
+)
+def test_api_missing_credentials(username: str | None, passwd: str | None) -> None:
+    """Test that api() requires both a username and a password."""
     with pytest.raises(exceptions.AuthenticationError):
-        api(passwd="Something")
+        api(username=username, passwd=passwd)
 
-    with pytest.raises(exceptions.AuthenticationError):
-        api(username="Something")
 
+def test_api() -> None:
+    """Test for api()."""
     m = None
     try:
         m = api(username="Something", passwd="Else")
@@ -27,3 +28,21 @@ def test_api() -> None:
         print(f"mokkari.api() raised {exc} unexpectedly!")
 
     assert m.__class__.__name__ == session.Session.__name__
+
+
+def test_api_context_manager() -> None:
+    """Test using the Session as a context manager."""
+    with api(username="Something", passwd="Else") as m:
+        assert isinstance(m, session.Session)
+        assert m._session.auth == ("Something", "Else")
+        assert m._session.headers["User-Agent"] == m.header["User-Agent"]
+
+
+def test_api_url_template() -> None:
+    """Test that a Session can be pointed at another server through api_url."""
+    cache = sqlite_cache.SqliteCache(":memory:")
+    cache.store("https://example.com/api/publisher/1/", {"id": 1})
+    with api(username="Something", passwd="Else", cache=cache) as m:
+        m.api_url = "https://example.com/api/{}/"
+        assert m._call(["publisher", 1]) == {"id": 1}
+    cache.close()
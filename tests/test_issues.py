@@ -8,7 +8,7 @@ from datetime import date
 from decimal import Decimal
 
 import pytest
-import requests_mock
+from requests_mock import Mocker
 
 from mokkari import exceptions
 from mokkari.session import Session
@@ -228,15 +228,14 @@ def test_tpb(talker: Session) -> None:
     assert len(hos.reprints) == 5
 
 
-def test_bad_issue(talker: Session) -> None:
+def test_bad_issue(talker: Session, requests_mock: Mocker) -> None:
     """Test for a non-existant issue."""
-    with requests_mock.Mocker() as r:
-        r.get(
-            "https://metron.cloud/api/issue/-1/",
-            text='{"response_code": 404, "detail": "Not found."}',
-        )
-        with pytest.raises(exceptions.ApiError):
-            talker.issue(-1)
+    requests_mock.get(
+        "https://metron.cloud/api/issue/-1/",
+        text='{"response_code": 404, "detail": "Not found."}',
+    )
+    with pytest.raises(exceptions.ApiError):
+        talker.issue(-1)
 
 
 def test_multi_page_results(talker: Session) -> None:
@@ -251,7 +250,7 @@ def test_multi_page_results(talker: Session) -> None:
     assert issues[863].cover_date == date(2011, 10, 1)
 
 
-def test_bad_issue_validate(talker: Session) -> None:
+def test_bad_issue_validate(talker: Session, requests_mock: Mocker) -> None:
     """Test data with invalid data."""
     # Change the 'number' field to an int, when it should be a string.
     data = {
@@ -277,11 +276,10 @@ def test_bad_issue_validate(talker: Session) -> None:
         "modified": "2019-06-23T15:13:18.212120-04:00",
     }
 
-    with requests_mock.Mocker() as r:
-        r.get(
-            "https://metron.cloud/api/issue/150/",
-            text=json.dumps(data),
-        )
+    requests_mock.get(
+        "https://metron.cloud/api/issue/150/",
+        text=json.dumps(data),
+    )
 
-        with pytest.raises(exceptions.ApiError):
-            talker.issue(150)
+    with pytest.raises(exceptions.ApiError):
+        talker.issue(150)
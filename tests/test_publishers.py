@@ -7,11 +7,22 @@ import json
 from datetime import datetime, timedelta, timezone
 
 import pytest
-import requests_mock
+from requests_mock import Mocker
 
 from mokkari import exceptions
 from mokkari.session import Session
 
+MARVEL_MODIFIED = datetime(
+    2024,
+    4,
+    7,
+    4,
+    53,
+    45,
+    729670,
+    tzinfo=timezone(timedelta(days=-1, seconds=72000), "-0400"),
+)
+
 
 def test_known_publishers(talker: Session) -> None:
     """Test for a known publisher."""
@@ -22,16 +33,7 @@ def test_known_publishers(talker: Session) -> None:
         == "https://static.metron.cloud/media/publisher/2018/11/11/marvel.jpg"
     )
     assert marvel.founded == 1939
-    assert marvel.modified == datetime(
-        2024,
-        4,
-        7,
-        4,
-        53,
-        45,
-        729670,
-        tzinfo=timezone(timedelta(days=-1, seconds=72000), "-0400"),
-    )
+    assert marvel.modified == MARVEL_MODIFIED
     assert marvel.resource_url.__str__() == "https://metron.cloud/publisher/marvel/"
 
 
@@ -46,18 +48,17 @@ def test_publisher_list(talker: Session) -> None:
     assert publishers[2].name == "AWA Studios"
 
 
-def test_bad_publisher(talker: Session) -> None:
+def test_bad_publisher(talker: Session, requests_mock: Mocker) -> None:
     """Test for a non-existent publisher."""
-    with requests_mock.Mocker() as r:
-        r.get(
-            "https://metron.cloud/api/publisher/-1/",
-            text='{"response_code": 404, "detail": "Not found."}',
-        )
-        with pytest.raises(exceptions.ApiError):
-            talker.publisher(-1)
+    requests_mock.get(
+        "https://metron.cloud/api/publisher/-1/",
+        text='{"response_code": 404, "detail": "Not found."}',
+    )
+    with pytest.raises(exceptions.ApiError):
+        talker.publisher(-1)
 
 
-def test_bad_publisher_validate(talker: Session) -> None:
+def test_bad_publisher_validate(talker: Session, requests_mock: Mocker) -> None:
     """Test data with invalid data."""
     # Change the 'name' field to an int, when it should be a string.
     data = {
@@ -69,11 +70,10 @@ def test_bad_publisher_validate(talker: Session) -> None:
         "modified": "2019-06-23T15:13:23.581612-04:00",
     }
 
-    with requests_mock.Mocker() as r:
-        r.get(
-            "https://metron.cloud/api/publisher/15/",
-            text=json.dumps(data),
-        )
+    requests_mock.get(
+        "https://metron.cloud/api/publisher/15/",
+        text=json.dumps(data),
+    )
 
-        with pytest.raises(exceptions.ApiError):
-            talker.publisher(15)
+    with pytest.raises(exceptions.ApiError):
+        talker.publisher(15)
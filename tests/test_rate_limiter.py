@@ -0,0 +1,48 @@
+"""Test Rate Limiter module.
+
+This module contains tests for RateLimiter objects.
+"""
+
+import pytest
+
+from mokkari import session
+from mokkari.session import RateLimiter
+
+
+@pytest.fixture
+def clock(monkeypatch: pytest.MonkeyPatch) -> list[float]:
+    """Replace the monotonic clock and sleep with a fake clock."""
+    now = [1000.0]
+    monkeypatch.setattr(session.time, "monotonic", lambda: now[0])
+    monkeypatch.setattr(session.time, "sleep", lambda s: now.__setitem__(0, now[0] + s))
+    return now
+
+
+def test_burst_does_not_sleep(clock: list[float]) -> None:
+    """Test that a full bucket allows a burst of calls without waiting."""
+    limiter = RateLimiter(calls=3, period=3)
+    for _ in range(3):
+        limiter.acquire()
+    assert clock[0] == 1000.0
+
+
+def test_sleeps_for_deficit(clock: list[float]) -> None:
+    """Test that an empty bucket only sleeps until the next token refills."""
+    limiter = RateLimiter(calls=2, period=1)
+    limiter.acquire()
+    limiter.acquire()
+    limiter.acquire()
+    assert clock[0] == pytest.approx(1000.5)
+    limiter.acquire()
+    assert clock[0] == pytest.approx(1001.0)
+
+
+def test_refills_over_time(clock: list[float]) -> None:
+    """Test that tokens refill while idle."""
+    limiter = RateLimiter(calls=2, period=1)
+    limiter.acquire()
+    limiter.acquire()
+    clock[0] += 1
+    limiter.acquire()
+    limiter.acquire()
+    assert clock[0] == pytest.approx(1001.0)
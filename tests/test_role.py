@@ -3,6 +3,9 @@
 This module contains tests for Role objects.
 """
 
+from requests_mock import Mocker
+
+from mokkari import api
 from mokkari.session import Session
 
 
@@ -15,3 +18,108 @@ def test_role_list(talker: Session) -> None:
     assert next(role_iter).name == "Assistant Editor"
     assert len(roles) == 11
     assert roles[1].name == "Consulting Editor"
+
+
+def test_role_list_pages(
+    dummy_username: str, dummy_password: str, requests_mock: Mocker
+) -> None:
+    """Test that every page of a multi page result is retrieved in order."""
+    m = api(username=dummy_username, passwd=dummy_password)
+    url = "https://metron.cloud/api/role/"
+    roles = [{"id": i, "name": f"Role {i}"} for i in range(5)]
+
+    requests_mock.get(
+        f"{url}?name=e",
+        complete_qs=True,
+        json={"count": 5, "next": f"{url}?name=e&page=2", "results": roles[:2]},
+    )
+    requests_mock.get(
+        f"{url}?name=e&page=2",
+        complete_qs=True,
+        json={"count": 5, "next": f"{url}?name=e&page=3", "results": roles[2:4]},
+    )
+    requests_mock.get(
+        f"{url}?name=e&page=3",
+        complete_qs=True,
+        json={"count": 5, "next": None, "results": roles[4:]},
+    )
+
+    result = m.role_list({"name": "e"})
+
+    assert [role.id for role in result] == [0, 1, 2, 3, 4]
+
+
+def test_role_list_stale_count(
+    dummy_username: str, dummy_password: str, requests_mock: Mocker
+) -> None:
+    """Test that pages past the end of a shrunken result set are skipped."""
+    m = api(username=dummy_username, passwd=dummy_password)
+    url = "https://metron.cloud/api/role/"
+    roles = [{"id": i, "name": f"Role {i}"} for i in range(4)]
+
+    # The first page counts results that were removed before page 3 was requested.
+    requests_mock.get(
+        f"{url}?name=e",
+        complete_qs=True,
+        json={"count": 6, "next": f"{url}?name=e&page=2", "results": roles[:2]},
+    )
+    requests_mock.get(
+        f"{url}?name=e&page=2",
+        complete_qs=True,
+        json={"count": 4, "next": None, "results": roles[2:]},
+    )
+    requests_mock.get(
+        f"{url}?name=e&page=3",
+        complete_qs=True,
+        status_code=404,
+        json={"detail": "Invalid page."},
+    )
+
+    result = m.role_list({"name": "e"})
+
+    assert [role.id for role in result] == [0, 1, 2, 3]
+
+
+def test_role_list_empty_first_page(
+    dummy_username: str, dummy_password: str, requests_mock: Mocker
+) -> None:
+    """Test following the 'next' links when the first page has no results."""
+    m = api(username=dummy_username, passwd=dummy_password)
+    url = "https://metron.cloud/api/role/"
+
+    requests_mock.get(
+        f"{url}?name=e",
+        complete_qs=True,
+        json={"count": 1, "next": f"{url}?name=e&page=2", "results": []},
+    )
+    requests_mock.get(
+        f"{url}?name=e&page=2",
+        complete_qs=True,
+        json={"count": 1, "next": None, "results": [{"id": 0, "name": "Role 0"}]},
+    )
+
+    assert [role.id for role in m.role_list({"name": "e"})] == [0]
+
+
+def test_role_list_from_later_page(
+    dummy_username: str, dummy_password: str, requests_mock: Mocker
+) -> None:
+    """Test that a list starting after page 1 retrieves each later page once."""
+    m = api(username=dummy_username, passwd=dummy_password)
+    url = "https://metron.cloud/api/role/"
+    roles = [{"id": i, "name": f"Role {i}"} for i in range(8)]
+
+    for page in range(2, 5):
+        requests_mock.get(
+            f"{url}?page={page}",
+            complete_qs=True,
+            json={
+                "count": 8,
+                "next": f"{url}?page={page + 1}" if page < 4 else None,
+                "results": roles[(page - 1) * 2 : page * 2],
+            },
+        )
+
+    result = m.role_list({"page": 2})
+
+    assert [role.id for role in result] == [2, 3, 4, 5, 6, 7]
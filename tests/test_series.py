@@ -7,11 +7,22 @@ import json
 from datetime import datetime, timedelta, timezone
 
 import pytest
-import requests_mock
+from requests_mock import Mocker
 
 from mokkari import exceptions
 from mokkari.session import Session
 
+DEATH_OF_THE_INHUMANS_MODIFIED = datetime(
+    2023,
+    10,
+    23,
+    16,
+    58,
+    50,
+    526656,
+    tzinfo=timezone(timedelta(days=-1, seconds=72000), "-0400"),
+)
+
 
 def test_series_with_imprint(talker: Session) -> None:
     """Test series from an imprint."""
@@ -33,16 +44,7 @@ def test_known_series(talker: Session) -> None:
     assert death.status == "Completed"
     assert death.publisher.id == 1
     assert death.publisher.name == "Marvel"
-    assert death.modified == datetime(
-        2023,
-        10,
-        23,
-        16,
-        58,
-        50,
-        526656,
-        tzinfo=timezone(timedelta(days=-1, seconds=72000), "-0400"),
-    )
+    assert death.modified == DEATH_OF_THE_INHUMANS_MODIFIED
     assert (
         death.resource_url.__str__()
         == "https://metron.cloud/series/death-of-the-inhumans-2018/"
@@ -82,18 +84,17 @@ def test_series_list(talker: Session) -> None:
     assert series[4].volume == 1
 
 
-def test_bad_series(talker: Session) -> None:
+def test_bad_series(talker: Session, requests_mock: Mocker) -> None:
     """Test for a non-existent series."""
-    with requests_mock.Mocker() as r:
-        r.get(
-            "https://metron.cloud/api/series/-1/",
-            text='{"response_code": 404, "detail": "Not found."}',
-        )
-        with pytest.raises(exceptions.ApiError):
-            talker.series(-1)
+    requests_mock.get(
+        "https://metron.cloud/api/series/-1/",
+        text='{"response_code": 404, "detail": "Not found."}',
+    )
+    with pytest.raises(exceptions.ApiError):
+        talker.series(-1)
 
 
-def test_bad_series_validate(talker: Session) -> None:
+def test_bad_series_validate(talker: Session, requests_mock: Mocker) -> None:
     """Test data with invalid data."""
     # Change the 'name' field to an int, when it should be a string.
     data = {
@@ -110,14 +111,13 @@ def test_bad_series_validate(talker: Session) -> None:
         "modified": "2019-07-05T14:32:52.256872-04:00",
         "image": "https://static.metron.cloud/media/issue/2019/02/06/gunhawks-1.jpg",
     }
-    with requests_mock.Mocker() as r:
-        r.get(
-            "https://metron.cloud/api/series/150/",
-            text=json.dumps(data),
-        )
-
-        with pytest.raises(exceptions.ApiError):
-            talker.series(150)
+    requests_mock.get(
+        "https://metron.cloud/api/series/150/",
+        text=json.dumps(data),
+    )
+
+    with pytest.raises(exceptions.ApiError):
+        talker.series(150)
 
 
 def test_series_with_associated_series(talker: Session) -> None:
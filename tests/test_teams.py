@@ -7,7 +7,7 @@ import json
 from datetime import date
 
 import pytest
-import requests_mock
+from requests_mock import Mocker
 
 from mokkari import exceptions
 from mokkari.session import Session
@@ -48,18 +48,17 @@ def test_team_issue_list(talker: Session) -> None:
     assert issues[0].cover_date == date(1965, 12, 1)
 
 
-def test_bad_team(talker: Session) -> None:
+def test_bad_team(talker: Session, requests_mock: Mocker) -> None:
     """Test for a non-existent team."""
-    with requests_mock.Mocker() as r:
-        r.get(
-            "https://metron.cloud/api/team/-1/",
-            text='{"response_code": 404, "detail": "Not found."}',
-        )
-        with pytest.raises(exceptions.ApiError):
-            talker.team(-1)
+    requests_mock.get(
+        "https://metron.cloud/api/team/-1/",
+        text='{"response_code": 404, "detail": "Not found."}',
+    )
+    with pytest.raises(exceptions.ApiError):
+        talker.team(-1)
 
 
-def test_bad_team_validate(talker: Session) -> None:
+def test_bad_team_validate(talker: Session, requests_mock: Mocker) -> None:
     """Test data with invalid data."""
     # Change the 'name' field to an int, when it should be a string.
     data = {
@@ -71,11 +70,10 @@ def test_bad_team_validate(talker: Session) -> None:
         "modified": "2019-06-23T15:13:23.927059-04:00",
     }
 
-    with requests_mock.Mocker() as r:
-        r.get(
-            "https://metron.cloud/api/team/150/",
-            text=json.dumps(data),
-        )
+    requests_mock.get(
+        "https://metron.cloud/api/team/150/",
+        text=json.dumps(data),
+    )
 
-        with pytest.raises(exceptions.ApiError):
-            talker.team(150)
+    with pytest.raises(exceptions.ApiError):
+        talker.team(150)
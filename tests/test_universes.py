@@ -6,7 +6,7 @@ This module contains tests for Universe objects.
 import json
 
 import pytest
-import requests_mock
+from requests_mock import Mocker
 
 from mokkari import exceptions
 from mokkari.schemas.universe import Universe
@@ -34,18 +34,17 @@ def test_universe_list(talker: Session) -> None:
     assert universes[1].name == "Age of Apocalypse"
 
 
-def test_bad_universe(talker: Session) -> None:
+def test_bad_universe(talker: Session, requests_mock: Mocker) -> None:
     """Test for a non-existent team."""
-    with requests_mock.Mocker() as r:
-        r.get(
-            "https://metron.cloud/api/universe/-1/",
-            text='{"response_code": 404, "detail": "Not found."}',
-        )
-        with pytest.raises(exceptions.ApiError):
-            talker.universe(-1)
+    requests_mock.get(
+        "https://metron.cloud/api/universe/-1/",
+        text='{"response_code": 404, "detail": "Not found."}',
+    )
+    with pytest.raises(exceptions.ApiError):
+        talker.universe(-1)
 
 
-def test_bad_universe_validate(talker: Session) -> None:
+def test_bad_universe_validate(talker: Session, requests_mock: Mocker) -> None:
     """Test data with invalid data."""
     # Change the 'name' field to an int, when it should be a string.
     data = {
@@ -57,11 +56,10 @@ def test_bad_universe_validate(talker: Session) -> None:
         "modified": "2019-06-23T15:13:23.927059-04:00",
     }
 
-    with requests_mock.Mocker() as r:
-        r.get(
-            "https://metron.cloud/api/universe/150/",
-            text=json.dumps(data),
-        )
+    requests_mock.get(
+        "https://metron.cloud/api/universe/150/",
+        text=json.dumps(data),
+    )
 
-        with pytest.raises(exceptions.ApiError):
-            talker.universe(150)
+    with pytest.raises(exceptions.ApiError):
+        talker.universe(150)